@@ -9,19 +9,53 @@ actual power cost for that day.  Since each CSV file represents the power usage
 """
 
 import argparse
-import csv
 import json
 import logging
+import math
 import os
 import sys
-from datetime import datetime
+import warnings
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 from holidays.countries import US
 
 logger = logging.getLogger(__name__)
 
+# EV time of use schedule, see calculate_ev_cost for the full definition
+SUMMER_PEAK_MONTHS = frozenset((5, 6, 7, 8, 9))
+SUMMER_PEAK_HOURS = frozenset((15, 16, 17, 18, 19))
+WINTER_PEAK_HOURS = frozenset((8, 9, 15, 16, 17, 18, 19))
+
+
+def build_peak_table() -> np.ndarray:
+    """Build the table of peak hours for every month, weekday and hour, ignoring holidays
+
+    Returns:
+        np.ndarray: bool array of shape (12, 7, 24), indexed by [month - 1, weekday, hour]
+    """
+    peak_table = np.zeros((12, 7, 24), dtype=np.bool_)
+    for month in range(1, 13):
+        peak_hours = WINTER_PEAK_HOURS
+        if month in SUMMER_PEAK_MONTHS:
+            peak_hours = SUMMER_PEAK_HOURS
+        # Only Monday thru Friday have peak hours
+        peak_table[month - 1, :5, sorted(peak_hours)] = True
+    return peak_table
+
+
+PEAK_TABLE = build_peak_table()
+# The same table as nested lists of bools, which is much quicker to index one entry at a time
+PEAK_LOOKUP = PEAK_TABLE.tolist()
+NO_PEAK_HOURS = [False] * 24
+
+# Columns of the per month totals from aggregate_monthly_usage
+KWH, BLOCK_COST, EV_COST, PEAK_KWH, PEAK_HOURS = range(5)
+
 
 class RockyMountainPowerHolidays(US):
     """Custom Holiday Class for Rocky Mountain Power Holidays
@@ -51,6 +85,43 @@ class RockyMountainPowerHolidays(US):
         self.pop_named("Columbus Day")
         self.pop_named("Veterans Day")
 
+    def ordinals(self, first_year: int, last_year: int) -> frozenset[int]:
+        """Get the holidays for a range of years as a set of date ordinals
+
+        Checking an int against a frozenset is a lot cheaper than a lookup on this object, which
+        has to normalize the date and check that its year is populated every time.
+
+        Args:
+            first_year: first year to include
+            last_year: last year to include
+
+        Returns:
+            frozenset[int]: date.toordinal() of every holiday in the years
+        """
+        holiday_dates = self[date(first_year, 1, 1) : date(last_year + 1, 1, 1)]
+        return frozenset(holiday_date.toordinal() for holiday_date in holiday_dates)
+
+
+def non_negative_int(value: str) -> int:
+    """Argparse type for a count that can be zero but not negative
+
+    Args:
+        value: command line string to convert
+
+    Returns:
+        int: the converted value
+
+    Raises:
+        argparse.ArgumentTypeError: if the value isn't a non-negative integer
+    """
+    try:
+        count = int(value)
+    except ValueError:
+        count = -1
+    if count < 0:
+        raise argparse.ArgumentTypeError(f"{value!r} is not a non-negative integer")
+    return count
+
 
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments
@@ -84,54 +155,64 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Specify this option if the directory is filled with CSVs in an alternative format",
     )
+    parser.add_argument(
+        "--jobs",
+        default=1,
+        help="Number of worker processes to parse the CSV files with, 0 for one per CPU.\n"
+        "Only worth it for many files",
+        type=non_negative_int,
+    )
     opts = parser.parse_args()
     logging.basicConfig(format="%(message)s", level=opts.log_level)
     return opts
 
 
 def hourly_usage_entries_from_rmp_csv_file(
-    date_object: datetime, csv_file: Path
-) -> list[datetime, float]:
-    """Given a date, and an RMP CSV file, get the list of hourly usages from that file
+    date_object: datetime, csv_file: str | Path
+) -> tuple[np.ndarray, np.ndarray]:
+    """Given a date, and an RMP CSV file, get the hourly usages from that file
 
     Args:
         date_object: date associated with CSV file
         csv_file: file with usage data for that day
 
     Returns:
-        list[tuple[datetime, float]]: List of tuples containing
-            datetime: datetime object with year, month, day, and hour that sample was taken.
+        tuple[np.ndarray, np.ndarray]: Tuple of equal length arrays containing
+            np.ndarray: datetime64[h] array with year, month, day, and hour that sample was taken.
                 Hour of 12 means it's for the usage between 12noon and 1pm
                 Hour of 23 means it's for the usage between 11pm and Midnight
                 Hour of 0 means it's for the usage between Midnight and 1am
-            float: kWh usage during this period
+            np.ndarray: float64 array of kWh usage during each period
+
+    Raises:
+        ValueError: if a row can't be parsed, or its hour isn't from 01:00 to 24:00
     """
-    hourly_entries = []
+    usage_hours = []
+    hour_kwh_usages = []
     with open(csv_file, newline="", encoding="utf-8") as file_obj:
-        reader = csv.reader(file_obj)
-        seen_header = False
-        for row in reader:
-            if not seen_header:
-                # This is the header!
-                seen_header = True
-            else:
-                # Get an int for the hour
-                usage_hour = int(row[0].split(":")[0]) - 1
-                usage_datetime = datetime(
-                    year=date_object.year,
-                    month=date_object.month,
-                    day=date_object.day,
-                    hour=usage_hour,
-                )
-                hour_kwh_usage = float(row[1])
-                hourly_entries.append((usage_datetime, hour_kwh_usage))
-    return hourly_entries
+        next(file_obj, None)  # This is the header!
+        for line in file_obj:
+            if not line.strip():
+                continue
+            # RMP rows always look like "24:00","14.706","73.0", with no embedded commas, so a
+            # plain split is enough and much cheaper than a general CSV parser on 24 rows
+            read_time, hour_kwh_usage, *_ = line.split(",", 2)
+            # RMP labels each hour by its end, so "01:00" is the usage between Midnight and 1am
+            end_hour = int(read_time.strip().strip('"').split(":")[0])
+            if not 1 <= end_hour <= 24:
+                # Anything else would land on the day before or after this file's day
+                raise ValueError(f"hour {end_hour} is out of range 1..24")
+            usage_hours.append(end_hour - 1)
+            hour_kwh_usages.append(float(hour_kwh_usage.strip().strip('"')))
+    base_datetime = np.datetime64(date_object.date(), "h")
+    timestamps = base_datetime + np.array(usage_hours, dtype="timedelta64[h]")
+    return timestamps, np.array(hour_kwh_usages, dtype=np.float64)
 
 
 def hourly_usage_entries_from_alternative_csv_file(
-    csv_file: Path,
-) -> list[datetime, float]:
-    """Given a Johnny CSV file, get the list of hourly usages from that file
+    csv_file: str | Path,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Given a Johnny CSV file, get the hourly usages from that file
 
     Alternative CSV format is as follows:
         Date,Time,Usage
@@ -150,43 +231,51 @@ def hourly_usage_entries_from_alternative_csv_file(
         csv_file: file with usage data for that day
 
     Returns:
-        list[tuple[datetime, float]]: List of tuples containing
-            datetime: datetime object with year, month, day, and hour that sample was taken.
+        tuple[np.ndarray, np.ndarray]: Tuple of equal length arrays containing
+            np.ndarray: datetime64[h] array with year, month, day, and hour that sample was taken.
                 Hour of 12 means it's for the usage between 12noon and 1pm
                 Hour of 23 means it's for the usage between 11pm and Midnight
                 Hour of 0 means it's for the usage between Midnight and 1am
-            float: kWh usage during this period
+            np.ndarray: float64 array of kWh usage during each period
+
+    Raises:
+        ValueError: if a time isn't an hour of the day from 0:00 to 23:00
     """
-    hourly_entries = []
-    with open(csv_file, newline="", encoding="utf-8") as file_obj:
-        reader = csv.reader(file_obj)
-        seen_header = False
-        for row in reader:
-            if not seen_header:
-                # This is the header!
-                seen_header = True
-            else:
-                # Get an int for the hour
-                date_parts = row[0].split("/")
-                date_month = int(date_parts[0])
-                date_day = int(date_parts[1])
-                date_year = int(date_parts[2])
-                usage_hour = int(row[1].split(":")[0])
-                hour_kwh_usage = float(row[2])
-
-                usage_datetime = datetime(
-                    year=date_year,
-                    month=date_month,
-                    day=date_day,
-                    hour=usage_hour,
-                )
-                hourly_entries.append((usage_datetime, hour_kwh_usage))
-    return hourly_entries
+    with warnings.catch_warnings():
+        # A header only file is just an empty day, not worth a warning
+        warnings.filterwarnings("ignore", message="loadtxt: input contained no data")
+        rows = np.loadtxt(
+            csv_file,
+            delimiter=",",
+            skiprows=1,
+            usecols=(0, 1, 2),
+            quotechar='"',
+            dtype=[("date", "U10"), ("time", "U5"), ("usage", np.float64)],
+            encoding="utf-8",
+            ndmin=1,
+        )
+    if rows.size == 0:
+        return np.empty(0, dtype="datetime64[h]"), np.empty(0, dtype=np.float64)
+    # A file holds many rows per date, so only parse each distinct date string once
+    unique_dates, date_indices = np.unique(rows["date"], return_inverse=True)
+    unique_days = np.array(
+        [datetime.strptime(date_str, "%m/%d/%Y") for date_str in unique_dates],
+        dtype="datetime64[h]",
+    )
+    usage_hours = np.char.partition(rows["time"], ":")[:, 0].astype(np.int64)
+    # Adding the hours as offsets would quietly roll 24:00 and up into the next day
+    bad_hours = (usage_hours < 0) | (usage_hours >= 24)
+    if bad_hours.any():
+        raise ValueError(
+            f"hour {usage_hours[bad_hours][0]} is out of range in {csv_file}"
+        )
+    timestamps = unique_days[date_indices] + usage_hours.astype("timedelta64[h]")
+    return timestamps, rows["usage"]
 
 
 def calculate_block_cost(
-    date_object: datetime, usage: float, usage_sum: float
-) -> float:
+    timestamps: np.ndarray, usage: np.ndarray, usage_sum: np.ndarray
+) -> np.ndarray:
     """Calculate the additional cost based on block pricing
 
     Definition of "bock pricing" comes from this document
@@ -207,63 +296,116 @@ def calculate_block_cost(
         - effective total increase is 36.72%
 
     Args:
-        date_object: object representing the day/hour in question
-        usage: usage
-        usage_sum: monthly usage so far
+        timestamps: datetime64[h] array of the day/hours in question
+        usage: usage for each hour
+        usage_sum: monthly usage so far, before each hour
 
     Returns:
-        float: cost in USD
+        np.ndarray: cost in USD for each hour
     """
-    month_index = date_object.month
+    month_index = timestamps.astype("datetime64[M]").astype(np.int64) % 12
     summer_months = [6, 7, 8, 9]
-    low_rate = 0.1092297096
-    high_rate = 0.14181282
-    if month_index in summer_months:
-        low_rate = 0.1234294488
-        high_rate = 0.160249512
-
-    if usage_sum + usage <= 400:  # Still in the first 400 kWh block
-        block_cost = usage * low_rate
-    elif usage_sum < 400:  # Split between the first and second blocks
-        first_block_usage = 400 - usage_sum
-        second_block_usage = usage - first_block_usage
-        block_cost = first_block_usage * low_rate + second_block_usage * high_rate
-    else:  # All in the second block
-        block_cost = usage * high_rate
+    is_summer = np.isin(np.arange(1, 13), summer_months)
+    # Work out the rates for each month of the year once, then pick them out for every hour
+    low_rate = np.where(is_summer, 0.1234294488, 0.1092297096)[month_index]
+    high_rate = np.where(is_summer, 0.160249512, 0.14181282)[month_index]
+
+    # Whatever is left of the first 400 kWh block goes at the low rate, the rest at the high rate
+    first_block_usage = np.clip(400 - usage_sum, 0, usage)
+    second_block_usage = usage - first_block_usage
+    block_cost = first_block_usage * low_rate + second_block_usage * high_rate
 
     return block_cost
 
 
-def is_peak_hour(
-    date_object: datetime, rmp_holidays: RockyMountainPowerHolidays
-) -> bool:
+def is_peak_hour(date_object: datetime, holiday_ordinals: frozenset[int]) -> bool:
     """Given a day/hour, determine if it's considered peak or not for time of usage billing
 
     Args:
         date_object: object representing the day/hour in question
-        rmp_holidays: Holiday object defining the RMP holidays
+        holiday_ordinals: ordinals of the RMP holidays, see RockyMountainPowerHolidays.ordinals
 
     Returns:
         bool: True if peak hour, else false
     """
-    usage_month = date_object.month
-    usage_hour = date_object.hour
-
-    summer_months = [5, 6, 7, 8, 9]
-    peak_hours = [8, 9, 15, 16, 17, 18, 19]
-    if usage_month in summer_months:
-        peak_hours = [15, 16, 17, 18, 19]
-
-    is_weekday = date_object.weekday() in range(0, 5)
-    is_holiday = date_object in rmp_holidays
-    peak_day = is_weekday and not is_holiday
-    is_peak = peak_day and usage_hour in peak_hours
+    month_peak_hours = PEAK_LOOKUP[date_object.month - 1]
+    peak_hour_of_week = month_peak_hours[date_object.weekday()][date_object.hour]
+    # Only look up the holiday when it could make a difference
+    is_peak = peak_hour_of_week and date_object.toordinal() not in holiday_ordinals
     return is_peak
 
 
+def rmp_holiday_days(
+    timestamps: np.ndarray, rmp_holidays: RockyMountainPowerHolidays
+) -> np.ndarray:
+    """Get all of the RMP holidays within the span of the given timestamps
+
+    Args:
+        timestamps: datetime64[h] array of the day/hours in question
+        rmp_holidays: Holiday object defining the RMP holidays
+
+    Returns:
+        np.ndarray: datetime64[D] array of the holidays
+    """
+    if timestamps.size == 0:
+        return np.empty(0, dtype="datetime64[D]")
+    days = timestamps.astype("datetime64[D]")
+    first_day = days.min().item()
+    last_day = days.max().item() + timedelta(days=1)
+    return np.array(rmp_holidays[first_day:last_day], dtype="datetime64[D]")
+
+
+def holiday_mask(days: np.ndarray, holiday_days: np.ndarray) -> np.ndarray:
+    """Given many days, determine which are holidays
+
+    Rather than searching the holidays for every entry, this marks them in a table with one flag
+    for each day from the first to the last of the given days, then looks each entry up directly.
+
+    Args:
+        days: datetime64[D] array of the days in question
+        holiday_days: datetime64[D] array of the RMP holidays, see rmp_holiday_days
+
+    Returns:
+        np.ndarray: bool array, True for each day that is a holiday
+    """
+    if days.size == 0:
+        return np.zeros(days.shape, dtype=np.bool_)
+    first_day = days.min()
+    day_offsets = (days - first_day).astype(np.int64)
+    holiday_offsets = (holiday_days - first_day).astype(np.int64)
+
+    is_holiday_day = np.zeros(day_offsets.max() + 1, dtype=np.bool_)
+    in_span = (holiday_offsets >= 0) & (holiday_offsets < is_holiday_day.size)
+    is_holiday_day[holiday_offsets[in_span]] = True
+    return is_holiday_day[day_offsets]
+
+
+def peak_hour_mask(timestamps: np.ndarray, holiday_days: np.ndarray) -> np.ndarray:
+    """Given many day/hours, determine which are considered peak for time of usage billing
+
+    This applies the same rules as is_peak_hour to a whole array at once.
+
+    Args:
+        timestamps: datetime64[h] array of the day/hours in question
+        holiday_days: datetime64[D] array of the RMP holidays, see rmp_holiday_days
+
+    Returns:
+        np.ndarray: bool array, True for each peak hour
+    """
+    days = timestamps.astype("datetime64[D]")
+    usage_month_index = timestamps.astype("datetime64[M]").astype(np.int64) % 12
+    # The epoch, 1970-01-01, was a Thursday, so this gives Monday as 0
+    usage_weekday = (days.astype(np.int64) + 3) % 7
+    usage_hour = timestamps.astype(np.int64) % 24
+
+    peak_hour_of_week = PEAK_TABLE[usage_month_index, usage_weekday, usage_hour]
+    is_holiday = holiday_mask(days=days, holiday_days=holiday_days)
+    return peak_hour_of_week & ~is_holiday
+
+
 def calculate_ev_cost(
-    date_object: datetime, usage: float, rmp_holidays: RockyMountainPowerHolidays
-) -> tuple[float, bool]:
+    timestamps: np.ndarray, usage: np.ndarray, holiday_days: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
     """Calculate the day's EV cost
 
     Definition taken from:
@@ -303,86 +445,160 @@ def calculate_ev_cost(
     will be considered a holiday and consequently Off-Peak.
 
     Args:
-        date_object: object representing the day/hour in question
-        usage: usage
-        rmp_holidays: Holiday object defining the RMP holidays
+        timestamps: datetime64[h] array of the day/hours in question
+        usage: usage for each hour
+        holiday_days: datetime64[D] array of the RMP holidays, see rmp_holiday_days
 
     Returns:
         Tuple containing:
-            float: usage cost in USD
-            bool: True if peak hour, else false
+            np.ndarray: usage cost in USD for each hour
+            np.ndarray: bool array, True for each peak hour
     """
-    peak_hour = is_peak_hour(date_object=date_object, rmp_holidays=rmp_holidays)
-    hour_rate = 0.0710998688
-    if peak_hour:
-        hour_rate = 0.3466289504
+    peak_hour = peak_hour_mask(timestamps=timestamps, holiday_days=holiday_days)
+    hour_rate = np.where(peak_hour, 0.3466289504, 0.0710998688)
 
     cost = usage * hour_rate
     return cost, peak_hour
 
 
+def fsum_by_month(values: np.ndarray, month_starts: np.ndarray) -> list[float]:
+    """Sum each month's run of values, using math.fsum so the totals don't drift
+
+    Args:
+        values: per hour values, sorted so that each month is contiguous
+        month_starts: index of the first entry of each month
+
+    Returns:
+        list[float]: the total for each month
+    """
+    return [
+        math.fsum(month_values) for month_values in np.split(values, month_starts[1:])
+    ]
+
+
+def aggregate_monthly_usage(
+    timestamps: np.ndarray, usage: np.ndarray, holiday_days: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Price every hour and total the usage and costs for each month, and over all months
+
+    This only works on plain arrays, all of the presentation is left to the caller.
+
+    Args:
+        timestamps: datetime64[h] array, one entry for each hour
+        usage: float64 array of kWh usage, one entry for each hour
+        holiday_days: datetime64[D] array of the RMP holidays, see rmp_holiday_days
+
+    Returns:
+        Tuple containing, one row per month in order:
+            np.ndarray: datetime64[M] month
+            np.ndarray: float64 totals of shape (months, 5), with the KWH, BLOCK_COST, EV_COST,
+                PEAK_KWH and PEAK_HOURS columns
+            np.ndarray: float64 overall totals of shape (5,), with the same columns
+    """
+    if timestamps.size == 0:
+        return (
+            np.empty(0, dtype="datetime64[M]"),
+            np.empty((0, 5), dtype=np.float64),
+            np.zeros(5, dtype=np.float64),
+        )
+
+    # Put the hours in order so that each month is one contiguous run of entries
+    order = np.argsort(timestamps, kind="stable")
+    timestamps = timestamps[order]
+    usage = usage[order]
+    months = timestamps.astype("datetime64[M]")
+    is_month_start = np.r_[True, months[1:] != months[:-1]]
+    month_starts = np.flatnonzero(is_month_start)
+
+    # The usage so far in the month, before each hour, decides which price block it lands in.
+    # Restart the running sum each month so rounding error can't carry across months.
+    usage_sum = np.concatenate(
+        [
+            np.r_[0.0, np.cumsum(month_usage[:-1])]
+            for month_usage in np.split(usage, month_starts[1:])
+        ]
+    )
+
+    block_cost = calculate_block_cost(
+        timestamps=timestamps, usage=usage, usage_sum=usage_sum
+    )
+    ev_cost, peak_hour = calculate_ev_cost(
+        timestamps=timestamps, usage=usage, holiday_days=holiday_days
+    )
+    peak_usage = np.where(peak_hour, usage, 0)
+
+    totals = np.empty((month_starts.size, 5), dtype=np.float64)
+    totals[:, KWH] = fsum_by_month(usage, month_starts)
+    totals[:, BLOCK_COST] = fsum_by_month(block_cost, month_starts)
+    totals[:, EV_COST] = fsum_by_month(ev_cost, month_starts)
+    totals[:, PEAK_KWH] = fsum_by_month(peak_usage, month_starts)
+    totals[:, PEAK_HOURS] = np.add.reduceat(peak_hour, month_starts, dtype=np.int64)
+
+    # Sum the hours themselves, not the monthly totals, so the overall totals are exactly rounded
+    overall_totals = np.empty(5, dtype=np.float64)
+    overall_totals[KWH] = math.fsum(usage)
+    overall_totals[BLOCK_COST] = math.fsum(block_cost)
+    overall_totals[EV_COST] = math.fsum(ev_cost)
+    overall_totals[PEAK_KWH] = math.fsum(peak_usage)
+    overall_totals[PEAK_HOURS] = np.count_nonzero(peak_hour)
+    return months[month_starts], totals, overall_totals
+
+
 def many_month_usage_summary_from_hourly_entries(
-    hourly_entries: list[tuple[datetime, float]],
+    timestamps: np.ndarray,
+    usage: np.ndarray,
     rmp_holidays: RockyMountainPowerHolidays,
-) -> dict[int, dict]:
+) -> dict[str, dict]:
     """Summarize many months of usage data
 
     Args:
-        date_path_tuples: list of tuples of datetime and float objects, one row for each hour
+        timestamps: datetime64[h] array, one entry for each hour
+        usage: float64 array of kWh usage, one entry for each hour
         rmp_holidays: Holiday object defining the RMP holidays
 
     Returns:
-        dict[int, dict]: each month's usage and cost summary
+        dict[str, dict]: each month's usage and cost summary, keyed by YYYY-MM, plus a SUMMARY
+
+    Raises:
+        ValueError: if there are no hourly entries to summarize
     """
+    if usage.size == 0:
+        raise ValueError("No hourly usage entries to summarize")
+    months, totals, overall_totals = aggregate_monthly_usage(
+        timestamps=timestamps,
+        usage=usage,
+        holiday_days=rmp_holiday_days(timestamps, rmp_holidays),
+    )
+
+    (
+        overall_kwh,
+        overall_block_cost,
+        overall_ev_cost,
+        overall_sum_peak_kwh,
+        overall_peak_hours,
+    ) = overall_totals.tolist()
+
+    # Months stay datetime64[M] through the math, they only become YYYY-MM strings here
     month_sums = {}
-    for date_object, hour_usage in hourly_entries:
-        month_key = f"{date_object.year}-{str(date_object.month).zfill(2)}"
-        if month_key not in month_sums:
-            month_sums[month_key] = {
-                "kWh": 0,
-                "block_cost": 0,
-                "ev_cost": 0,
-                "sum_peak_kWh": 0,
-            }
-
-        block_cost = calculate_block_cost(
-            date_object=date_object,
-            usage=hour_usage,
-            usage_sum=month_sums[month_key]["kWh"],
-        )
-        ev_cost, peak_hour = calculate_ev_cost(
-            date_object=date_object, usage=hour_usage, rmp_holidays=rmp_holidays
-        )
-        month_sums[month_key]["kWh"] += hour_usage
-        month_sums[month_key]["block_cost"] += block_cost
-        month_sums[month_key]["ev_cost"] += ev_cost
-        if peak_hour:
-            month_sums[month_key]["sum_peak_kWh"] += hour_usage
-
-    overall_block_cost = 0
-    overall_ev_cost = 0
-    overall_kwh = 0
-    overall_sum_peak_kwh = 0
-    for _month, m_dict in month_sums.items():
-        m_dict["difference"] = round(m_dict["block_cost"] - m_dict["ev_cost"], 3)
-        m_dict["off_peak_%"] = round(
-            100 * ((m_dict["kWh"] - m_dict["sum_peak_kWh"])) / m_dict["kWh"], 3
-        )
-        overall_block_cost += m_dict["block_cost"]
-        overall_ev_cost += m_dict["ev_cost"]
-        overall_kwh += m_dict["kWh"]
-        overall_sum_peak_kwh += m_dict["sum_peak_kWh"]
-        m_dict["kWh"] = round(m_dict["kWh"], 3)
-        m_dict["block_cost"] = round(m_dict["block_cost"], 3)
-        m_dict["ev_cost"] = round(m_dict["ev_cost"], 3)
-        m_dict["sum_peak_kWh"] = round(m_dict["sum_peak_kWh"], 3)
+    for month_key, (kwh, block_cost, ev_cost, sum_peak_kwh, peak_hours) in zip(
+        np.datetime_as_string(months).tolist(), totals.tolist()
+    ):
+        month_sums[month_key] = {
+            "kWh": round(kwh, 3),
+            "block_cost": round(block_cost, 3),
+            "ev_cost": round(ev_cost, 3),
+            "difference": round(block_cost - ev_cost, 3),
+            # Without any peak hours nothing is ever added to the peak total, so it stays an int
+            "sum_peak_kWh": round(sum_peak_kwh, 3) if peak_hours else 0,
+            "off_peak_%": round(100 * (kwh - sum_peak_kwh) / kwh, 3),
+        }
 
     month_sums["SUMMARY"] = {
         "kWh": round(overall_kwh, 3),
         "block_cost": round(overall_block_cost, 3),
         "ev_cost": round(overall_ev_cost, 3),
         "difference": round(overall_block_cost - overall_ev_cost, 3),
-        "sum_peak_kWh": round(overall_sum_peak_kwh, 3),
+        "sum_peak_kWh": round(overall_sum_peak_kwh, 3) if overall_peak_hours else 0,
         "off_peak_%": round(
             100 * (overall_kwh - overall_sum_peak_kwh) / overall_kwh, 3
         ),
@@ -391,99 +607,175 @@ def many_month_usage_summary_from_hourly_entries(
     return month_sums
 
 
-def find_csv_files(root_dir: Path) -> list[Path]:
-    """Finds all CSV files in a directory
+def iter_csv_files(root_dir: str | Path) -> Iterator[str]:
+    """Yields all CSV files in a directory
 
     Args:
         root_dir: top directory to search
 
+    Yields:
+        path string of each CSV file under the directory
+    """
+    pending_dirs = [root_dir]
+    while pending_dirs:
+        try:
+            entries = os.scandir(pending_dirs.pop())
+        except OSError as err:
+            # Like os.walk, skip directories that can't be listed rather than stopping
+            logger.debug("Skipping %s: %s", err.filename, err)
+            continue
+        with entries:
+            for entry in entries:
+                # DirEntry caches the type from the directory listing, so this needs no extra stat
+                if entry.is_dir(follow_symlinks=False):
+                    pending_dirs.append(entry.path)
+                elif entry.name.endswith(".csv") and not entry.is_dir():
+                    yield entry.path
+
+
+def concatenate_hourly_usage_entries(
+    hourly_entries: list[tuple[np.ndarray, np.ndarray]],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Join the per file hourly usage arrays into one pair of arrays
+
+    Args:
+        hourly_entries: list of (timestamps, usage) array tuples, one for each file
+
     Returns:
-        a list of Paths to all CSV files under the directory
+        tuple[np.ndarray, np.ndarray]: all timestamps and all usages, in input order
     """
-    csv_files = []
+    if not hourly_entries:
+        return np.empty(0, dtype="datetime64[h]"), np.empty(0, dtype=np.float64)
+    timestamps = np.concatenate([entry[0] for entry in hourly_entries])
+    usage = np.concatenate([entry[1] for entry in hourly_entries])
+    return timestamps, usage
+
+
+def parse_csv_files(
+    parse_function: Callable[[str | Path], Any],
+    csv_files: Iterable[str | Path],
+    jobs: int = 1,
+) -> Iterator[tuple[str | Path, Any]]:
+    """Run a parse function over each CSV file, optionally spread over worker processes
+
+    With a single job the files are parsed one at a time as they are consumed, so the file
+    list can be streamed straight from iter_csv_files.
+
+    Args:
+        parse_function: module level function that takes a single CSV file
+        csv_files: files to analyze
+        jobs: number of worker processes, 1 parses the files in this process and 0 uses one
+            worker per CPU
+
+    Raises:
+        ValueError: if jobs is negative
+
+    Yields:
+        tuple[str | Path, Any]: each file and the result of the parse function for it, in order
+    """
+    if jobs < 0:
+        raise ValueError(f"jobs must be non-negative, not {jobs}")
+    if jobs != 1:
+        csv_files = list(csv_files)
+        # ProcessPoolExecutor starts os.cpu_count() workers when max_workers is None
+        max_workers = jobs if jobs > 1 else None
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(parse_function, csv_files, chunksize=32)
+            yield from zip(csv_files, results)
+    else:
+        for csv_file in csv_files:
+            yield csv_file, parse_function(csv_file)
+
 
-    # Use walk to find all .csv files recursively
-    for root, _dirs, files in os.walk(root_dir):
-        for file in files:
-            if file.endswith(".csv"):
-                # Append the full path of the CSV file to the list
-                csv_files.append(Path(root) / file)
+def _parse_rmp(
+    csv_file: str | Path,
+) -> tuple[np.ndarray, np.ndarray] | ValueError | None:
+    """Parse a single RMP CSV file named YYYY-MM-DD.csv
 
-    return csv_files
+    None if the name isn't a date, or the error if the contents can't be parsed, so that the
+    caller can report it even when this ran in a worker process.
+    """
+    name = os.path.basename(csv_file)
+    # The name format is fixed, so check and slice it rather than going through strptime
+    if len(name) != 14 or name[4] != "-" or name[7] != "-" or name[10:] != ".csv":
+        return None
+    try:
+        date_object = datetime(int(name[0:4]), int(name[5:7]), int(name[8:10]))
+    except ValueError:
+        return None
+    try:
+        return hourly_usage_entries_from_rmp_csv_file(
+            date_object=date_object, csv_file=csv_file
+        )
+    except ValueError as err:
+        return err
 
 
 def get_hourly_usage_entries_from_rmp_csvs(
-    csv_files: list[Path],
-) -> list[tuple[datetime, float]]:
-    """Given a list of RMP CSV files, named YYYY-MM-DD, return list of hourly usage entries
+    csv_files: Iterable[str | Path], jobs: int = 1
+) -> tuple[np.ndarray, np.ndarray]:
+    """Given RMP CSV files, named YYYY-MM-DD, return arrays of hourly usage entries
 
     Args:
-        csv_files: list of files to analyze
+        csv_files: files to analyze
+        jobs: number of worker processes to parse the files with
 
     Returns:
-        list[tuple[datetime, float]]: List of tuples containing
-            datetime: datetime object with year, month, day, and hour that sample was taken.
-                Hour of 13 means it's for the usage between 12noon and 1pm
-                Hour of 24 means it's for the usage between 11pm and Midnight
-                Hour of 1 means it's for the usage between Midnight and 1am
-            float: kWh usage during this period
+        tuple[np.ndarray, np.ndarray]: Tuple of equal length arrays containing
+            np.ndarray: datetime64[h] array with year, month, day, and hour that sample was taken.
+                Hour of 12 means it's for the usage between 12noon and 1pm
+                Hour of 23 means it's for the usage between 11pm and Midnight
+                Hour of 0 means it's for the usage between Midnight and 1am
+            np.ndarray: float64 array of kWh usage during each period
     """
     hourly_usage_entries = []
-    date_format = "%Y-%m-%d.csv"  # Format for the date string
-    for csv_file in csv_files:
-        try:
-            date_object = datetime.strptime(csv_file.name, date_format)
-            hourly_entries = hourly_usage_entries_from_rmp_csv_file(
-                date_object=date_object, csv_file=csv_file
+    for csv_file, hourly_entries in parse_csv_files(_parse_rmp, csv_files, jobs=jobs):
+        if hourly_entries is None:
+            logger.warning(
+                "WARNING: %s doesn't match YYYY-MM-DD.csv format!!!", csv_file
             )
-            hourly_usage_entries += hourly_entries
-        except ValueError:
+            continue
+        if isinstance(hourly_entries, ValueError):
             logger.warning(
-                f"WARNING: {csv_file} doesn't match YYYY-MM-DD.csv format!!!"
+                "WARNING: skipping %s, couldn't parse its contents: %s",
+                csv_file,
+                hourly_entries,
             )
             continue
-    return hourly_usage_entries
+        hourly_usage_entries.append(hourly_entries)
+    return concatenate_hourly_usage_entries(hourly_usage_entries)
 
 
 def get_hourly_usage_entries_from_alternative_csvs(
-    csv_files: list[Path],
-) -> list[tuple[datetime, float]]:
-    """Given a list of Alternative CSV files, return list of hourly usage entries
+    csv_files: Iterable[str | Path], jobs: int = 1
+) -> tuple[np.ndarray, np.ndarray]:
+    """Given Alternative CSV files, return arrays of hourly usage entries
 
     Args:
-        csv_files: list of files to analyze
+        csv_files: files to analyze
+        jobs: number of worker processes to parse the files with
 
     Returns:
-        list[tuple[datetime, float]]: List of tuples containing
-            datetime: datetime object with year, month, day, and hour that sample was taken.
-                Hour of 13 means it's for the usage between 12noon and 1pm
-                Hour of 24 means it's for the usage between 11pm and Midnight
-                Hour of 1 means it's for the usage between Midnight and 1am
-            float: kWh usage during this period
+        tuple[np.ndarray, np.ndarray]: Tuple of equal length arrays containing
+            np.ndarray: datetime64[h] array with year, month, day, and hour that sample was taken.
+                Hour of 12 means it's for the usage between 12noon and 1pm
+                Hour of 23 means it's for the usage between 11pm and Midnight
+                Hour of 0 means it's for the usage between Midnight and 1am
+            np.ndarray: float64 array of kWh usage during each period
     """
-    hourly_usage_entries = []
-    for csv_file in csv_files:
-        hourly_entries = hourly_usage_entries_from_alternative_csv_file(
-            csv_file=csv_file
+    hourly_usage_entries = [
+        hourly_entries
+        for _csv_file, hourly_entries in parse_csv_files(
+            hourly_usage_entries_from_alternative_csv_file, csv_files, jobs=jobs
         )
-        hourly_usage_entries += hourly_entries
-    return hourly_usage_entries
-
-
-def sort_dict_recursively(d: Any) -> Any:
-    """Recursively sort a dictionary by its keys."""
-    if isinstance(d, dict):
-        return {k: sort_dict_recursively(v) for k, v in sorted(d.items())}
-    elif isinstance(d, list):
-        return [sort_dict_recursively(i) for i in d]
-    else:
-        return d
+    ]
+    return concatenate_hourly_usage_entries(hourly_usage_entries)
 
 
 def pretty_str_dict(d: dict[str, Any]) -> str:
     """Return a string of a dictionary with keys sorted recursively."""
-    sorted_dict = sort_dict_recursively(d)
-    return json.dumps(sorted_dict, indent=4, sort_keys=True)
+    # sort_keys applies at every nesting level, so there's no need to pre-sort the dict
+    return json.dumps(d, indent=4, sort_keys=True)
 
 
 def main() -> int:
@@ -493,18 +785,21 @@ def main() -> int:
         Unix style return code, 0 for pass.
     """
     opts = parse_args()
-    all_csv_files = find_csv_files(root_dir=opts.directory)
+    all_csv_files = iter_csv_files(root_dir=opts.directory)
     rmp_holidays = RockyMountainPowerHolidays()
     if opts.alternative_format:
-        hourly_usage_entries = get_hourly_usage_entries_from_alternative_csvs(
-            csv_files=all_csv_files
+        timestamps, usage = get_hourly_usage_entries_from_alternative_csvs(
+            csv_files=all_csv_files, jobs=opts.jobs
         )
     else:
-        hourly_usage_entries = get_hourly_usage_entries_from_rmp_csvs(
-            csv_files=all_csv_files
+        timestamps, usage = get_hourly_usage_entries_from_rmp_csvs(
+            csv_files=all_csv_files, jobs=opts.jobs
         )
+    if usage.size == 0:
+        logger.error("ERROR: no hourly usage entries found in %s", opts.directory)
+        return 1
     stats = many_month_usage_summary_from_hourly_entries(
-        hourly_entries=hourly_usage_entries, rmp_holidays=rmp_holidays
+        timestamps=timestamps, usage=usage, rmp_holidays=rmp_holidays
     )
     logger.info(pretty_str_dict(stats))
 
@@ -8,9 +8,14 @@ physical display in the house somewhere.
 import argparse
 import logging
 import sys
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
 
-from compare_power_costs import RockyMountainPowerHolidays, is_peak_hour
+from compare_power_costs import (
+    NO_PEAK_HOURS,
+    PEAK_LOOKUP,
+    RockyMountainPowerHolidays,
+    is_peak_hour,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -42,37 +47,36 @@ def parse_args() -> argparse.Namespace:
 
 
 def find_next_peak_change(
-    date_object: datetime, rmp_holidays: RockyMountainPowerHolidays
+    date_object: datetime, holiday_ordinals: frozenset[int]
 ) -> timedelta:
     """Find the next change in peak status from the given date_object
 
     This is useful for being able to display a countdown timer until the next change in peak status
 
+    Rather than checking hour by hour, this takes a whole day's peak hours at a time and searches
+    them for the first hour with the other status, so it only steps once per day.
+
     Args:
         date_object: initial datetime object to start analysis from
-        rmp_holidays: Holiday object defining the RMP holidays
+        holiday_ordinals: ordinals of the RMP holidays, see RockyMountainPowerHolidays.ordinals
 
     Returns:
         timedelta: time until next change in peak status
     """
-    initial_peak = is_peak_hour(date_object=date_object, rmp_holidays=rmp_holidays)
-    # Ensure start_datetime is at the start of the hour
-    if (
-        date_object.minute != 0
-        or date_object.second != 0
-        or date_object.microsecond != 0
-    ):
-        iter_datetime = date_object.replace(
-            minute=0, second=0, microsecond=0
-        ) + timedelta(hours=1)
-
-    while (
-        is_peak_hour(date_object=iter_datetime, rmp_holidays=rmp_holidays)
-        == initial_peak
-    ):
-        iter_datetime += timedelta(hours=1)
-
-    return iter_datetime - date_object
+    changed_peak = not is_peak_hour(
+        date_object=date_object, holiday_ordinals=holiday_ordinals
+    )
+    day = date_object.date()
+    start_hour = date_object.hour + 1
+    while True:
+        day_peak_hours = PEAK_LOOKUP[day.month - 1][day.weekday()]
+        if day.toordinal() in holiday_ordinals:
+            day_peak_hours = NO_PEAK_HOURS
+        if changed_peak in day_peak_hours[start_hour:]:
+            change_hour = day_peak_hours.index(changed_peak, start_hour)
+            return datetime.combine(day, time(hour=change_hour)) - date_object
+        day += timedelta(days=1)
+        start_hour = 0
 
 
 def main() -> int:
@@ -84,9 +88,13 @@ def main() -> int:
     _opts = parse_args()
     time_now = datetime.now()
     rmp_holidays = RockyMountainPowerHolidays()
-    is_peak = is_peak_hour(date_object=time_now, rmp_holidays=rmp_holidays)
+    # The next change is never more than a long weekend away, so next year is as far as it goes
+    holiday_ordinals = rmp_holidays.ordinals(
+        first_year=time_now.year, last_year=time_now.year + 1
+    )
+    is_peak = is_peak_hour(date_object=time_now, holiday_ordinals=holiday_ordinals)
     next_peak_change_delta = find_next_peak_change(
-        date_object=time_now, rmp_holidays=rmp_holidays
+        date_object=time_now, holiday_ordinals=holiday_ordinals
     )
     logger.info(f"CURRENT_TIME: {time_now}")
     logger.info(f"IS_PEAK: {is_peak}")